@@ -5,6 +5,13 @@ from .events import SeattleEventScraper
 # from .bills import SeattleBillScraper
 # from .vote_events import SeattleVoteEventScraper
 
+# Council seats: 7 district seats plus 2 at-large positions
+POSTS = tuple(
+    (f"District {i}" if i <= 7 else f"Position {i}", "Councilmember")
+    for i in range(1, 10)
+)
+
+
 class Seattle(Jurisdiction):
     division_id = "ocd-division/country:us/state:wa/place:seattle"
     classification = "legislature"
@@ -25,18 +32,7 @@ class Seattle(Jurisdiction):
             classification="legislature"
         )
 
-        # Add district seats (7 districts)
-        for i in range(1, 8):
-            org.add_post(
-                label=f"District {i}",
-                role="Councilmember"
-            )
-
-        # Add at-large positions (2 positions)
-        for i in range(8, 10):
-            org.add_post(
-                label=f"Position {i}",
-                role="Councilmember"
-            )
+        for label, role in POSTS:
+            org.add_post(label=label, role=role)
 
         yield org
\ No newline at end of file
@@ -6,16 +6,26 @@ and converts it into Pupa's Event model format for Open Civic Data.
 
 Learning Goals:
 - Working with REST APIs using requests library
-- Date/time handling with datetime and pytz
+- Date/time handling with datetime and zoneinfo
 - Python list comprehensions and generator patterns
 - Pupa's Event model structure
 """
 
 from pupa.scrape import Scraper, Event
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+import ijson
+import io
 import requests
+import urllib3
 import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import logging
+import re
+
+from .utils import make_session
 
 # Set up logging to help with debugging
 # This is a Python best practice - better than using print() statements
@@ -37,22 +47,54 @@ class SeattleEventScraper(Scraper):
     BASE_URL = "https://webapi.legistar.com/v1/seattle"
     
     # Seattle's timezone - crucial for converting timestamps correctly
-    # pytz is the standard Python library for timezone handling
-    TIMEZONE = pytz.timezone("America/Los_Angeles")
+    # zoneinfo is the standard library's timezone support (Python 3.9+)
+    TIMEZONE_NAME = "America/Los_Angeles"
+    TIMEZONE = ZoneInfo(TIMEZONE_NAME)
     
     # Start scraping from 2019 (as discussed)
     # We'll filter API requests to only get events from this year forward
     START_YEAR = 2019
+
+    # OData query parameters for the event list
+    # Legistar uses OData protocol (like SQL for REST APIs)
+    # The $ prefix is OData convention
+    # Built once here; MappingProxyType makes it read-only, so the same
+    # params (and HTTP cache key) are used on every run
+    _PARAMS = MappingProxyType({
+        # Filter: get events from START_YEAR onward
+        # 'ge' means 'greater than or equal'
+        "$filter": f"EventDate ge datetime'{START_YEAR}-01-01'",
+
+        # Sort by date descending (newest first)
+        "$orderby": "EventDate desc",
+    })
+
+    # Maximum number of agenda-item requests in flight at once
+    # Keeps us from hammering Legistar while still overlapping network waits
+    MAX_WORKERS = 8
+
+    # How many events' agenda items to request in a single API call
+    AGENDA_BATCH_SIZE = 50
+
+    # Legistar caps every response at 1000 rows
+    PAGE_SIZE = 1000
     
     # Event items to ignore (procedural, not substantive)
     # Python convention: ALL_CAPS for constants that shouldn't change
-    IGNORE_PATTERNS = [
-        "CALL TO ORDER",
-        "ROLL CALL",
-        "APPROVAL OF",
-        "ADJOURNMENT",
-        "RECESS",
-    ]
+    # re.compile() builds the pattern once when the class is defined;
+    # re.IGNORECASE means we don't have to .upper() every title
+    IGNORE_RE = re.compile(
+        r'^\s*(?:CALL TO ORDER|ROLL CALL|APPROVAL OF\b|ADJOURNMENT|RECESS)',
+        re.IGNORECASE
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # One HTTP session for all Legistar calls, shared by the worker
+        # threads, so connections (and TLS handshakes) are reused.
+        # Cached on disk when SEATTLE_SCRAPER_CACHE=1
+        self._session = make_session("legistar")
     
     def scrape(self):
         """
@@ -66,14 +108,42 @@ class SeattleEventScraper(Scraper):
             Event objects that Pupa will validate and save
         """
 
-        # Step 1: Get all events from Legistar
-        events = self._fetch_events()
+        # Step 1: Stream events from Legistar, dropping duplicates as they arrive
+        unique_events = self._unique_events(self._fetch_events())
+
+        # Step 2: Work through the events in windows of AGENDA_BATCH_SIZE
+        # Each window's agenda items come from one request, and up to
+        # MAX_WORKERS windows are fetched in the background while earlier
+        # ones are yielded, so events go out before the whole list arrives
+        # itertools.islice pulls the next window off the iterator;
+        # iter(callable, sentinel) stops once a window comes back empty
+        windows = iter(lambda: list(islice(unique_events, self.AGENDA_BATCH_SIZE)), [])
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for window in windows:
+                event_ids = [api_event.get('EventId') for api_event in window]
+                future = executor.submit(self._fetch_agenda_batch, event_ids)
+                pending.append((window, future))
+
+                if len(pending) >= self.MAX_WORKERS:
+                    yield from self._parse_window(*pending.popleft())
+
+            while pending:
+                yield from self._parse_window(*pending.popleft())
+
+    def _unique_events(self, events):
+        """
+        Drop repeated events (same body and date) from a stream of events.
+
+        Yields:
+            Event dictionaries, first occurrence only
+        """
 
         # Track seen events to avoid duplicates
         # Use a set of (name, date) tuples for fast lookup
         seen_events = set()
 
-        # Step 2: Process each event
         for api_event in events:
             # Create a unique key for deduplication
             event_key = (
@@ -83,14 +153,39 @@ class SeattleEventScraper(Scraper):
 
             # Skip if we've already seen this event
             if event_key in seen_events:
-                logger.debug(f"Skipping duplicate event: {event_key}")
+                logger.debug("Skipping duplicate event: %s", event_key)
                 continue
 
             # Mark as seen
             seen_events.add(event_key)
+            yield api_event
+
+    def _parse_window(self, window, future):
+        """
+        Convert one window of events into Pupa Events.
+
+        Args:
+            window: List of event dictionaries from the API
+            future: Future holding the window's agenda items
+                (see _fetch_agenda_batch)
+
+        Yields:
+            Event objects
+        """
+
+        agendas = future.result()
+
+        for api_event in window:
+            event_id = api_event.get('EventId')
+
+            # Skip events whose agenda fetch failed, rather than yielding
+            # them with no items and wiping the agenda pupa already stored
+            if agendas is None or event_id not in agendas:
+                logger.warning("Skipping event %s: agenda items unavailable", event_id)
+                continue
 
             # Convert Legistar API event to Pupa Event model
-            event = self._parse_event(api_event)
+            event = self._parse_event(api_event, agendas[event_id])
 
             # Only yield if we successfully created an event
             if event:
@@ -103,65 +198,129 @@ class SeattleEventScraper(Scraper):
         Python Convention: Methods starting with _ are "private"
         (not enforced, just a naming convention to signal intent)
         
-        Returns:
-            List of event dictionaries from the API
+        This is a generator, so events are handed to scrape() while the
+        response is still downloading.
+
+        Yields:
+            Event dictionaries from the API
         """
         
         # Build the API endpoint URL
         url = f"{self.BASE_URL}/events"
         
-        # Calculate start date for filtering
-        # datetime is Python's standard library for date/time operations
-        start_date = datetime.datetime(self.START_YEAR, 1, 1)
-        
-        # OData query parameters for filtering
-        # Legistar uses OData protocol (like SQL for REST APIs)
-        # The $ prefix is OData convention
-        params = {
-            # Filter: get events from START_YEAR onward
-            # 'ge' means 'greater than or equal'
-            "$filter": f"EventDate ge datetime'{start_date.strftime('%Y-%m-%d')}'",
-            
-            # Sort by date descending (newest first)
-            "$orderby": "EventDate desc",
-        }
-        
         # Make the API request
         # Try/except is Python's error handling - similar to C#'s try/catch
         try:
-            # requests.get() is the standard way to make HTTP GET requests in Python
+            # self._session.get() works like requests.get() but reuses connections
             # timeout=30 prevents hanging forever if the API is slow
-            response = requests.get(url, params=params, timeout=30)
-            
-            # Raise an exception if we got an error status code (4xx, 5xx)
-            # This will jump to the 'except' block below
-            response.raise_for_status()
-            
-            # Parse JSON response
-            # .json() automatically converts JSON string to Python dict/list
-            events = response.json()
+            # stream=True hands us the body as it arrives instead of all at once
+            # 'with' closes the connection even if we stop reading early
+            with self._session.get(url, params=self._PARAMS, timeout=30, stream=True) as response:
+                # Raise an exception if we got an error status code (4xx, 5xx)
+                # This will jump to the 'except' block below
+                response.raise_for_status()
+
+                if getattr(response, 'from_cache', False):
+                    # A cached response's raw body has already been read;
+                    # its (decoded) bytes are in response.content instead
+                    body = io.BytesIO(response.content)
+                else:
+                    # Let urllib3 undo gzip/deflate so ijson sees plain JSON
+                    response.raw.decode_content = True
+                    body = response.raw
+
+                # Parse JSON response incrementally
+                # ijson.items() yields each element of the top-level array
+                # as soon as it has been read, so we never hold the whole
+                # response in memory (it uses the C yajl2 backend when available)
+                count = 0
+                for api_event in ijson.items(body, 'item'):
+                    count += 1
+                    yield api_event
             
             # Log success for debugging
-            # f-strings (f"...{variable}...") are Python 3.6+ string formatting
-            logger.info(f"Fetched {len(events)} events from Legistar API")
+            # Pass values as arguments instead of using an f-string: logging
+            # only formats the message if it's actually going to be emitted
+            logger.info("Fetched %d events from Legistar API", count)
             
-            return events
-            
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException,
+                urllib3.exceptions.HTTPError,
+                ijson.JSONError) as e:
             # Log the error - don't crash, just warn
             # This is more robust than letting the scraper die
-            logger.error(f"Failed to fetch events from Legistar: {e}")
-            
-            # Return empty list so the scraper can continue
-            # Python idiom: it's often better to return empty collections than None
-            return []
+            # The generator simply stops, so the scraper can continue
+            logger.error("Failed to fetch events from Legistar: %s", e)
+
+    def _fetch_agenda_batch(self, event_ids):
+        """
+        Fetch the agenda items for a batch of Legistar events in one query.
+
+        Args:
+            event_ids: List of Legistar event IDs
+
+        Returns:
+            Dict mapping each event ID to its list of agenda item dicts
+            (empty for events with no items), or None if the request fails
+        """
+
+        # Every event gets an entry, even if it has no agenda items
+        agendas = {event_id: [] for event_id in event_ids if event_id is not None}
+
+        if not agendas:
+            return agendas
+
+        url = f"{self.BASE_URL}/eventitems"
+        params = {
+            # "EventItemEventId eq 1 or EventItemEventId eq 2 or ..."
+            "$filter": " or ".join(
+                f"EventItemEventId eq {event_id}" for event_id in agendas
+            ),
+            # $skip paging needs a unique, stable sort key; grouping by event
+            # later keeps each agenda in minutes order
+            "$orderby": "EventItemEventId, EventItemMinutesSequence, EventItemId",
+        }
+
+        items = []
+
+        try:
+            # Legistar returns at most PAGE_SIZE rows per response,
+            # so keep asking for the next page until we get a short one
+            while True:
+                params["$skip"] = len(items)
+                response = self._session.get(url, params=params, timeout=30)
+                response.raise_for_status()
+
+                page = response.json()
+                items.extend(page)
+
+                if len(page) < self.PAGE_SIZE:
+                    break
+
+            # Group the combined response back by event
+            for api_item in items:
+                agendas.setdefault(api_item['EventItemEventId'], []).append(api_item)
+
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to fetch agenda items for events %s: %s", event_ids, e)
+            return None
+
+        except (KeyError, TypeError, ValueError) as e:
+            # KeyError/TypeError: response wasn't a list of agenda item dicts
+            # ValueError: response body wasn't JSON
+            # Skip just this batch instead of letting the worker thread's
+            # exception abort the whole scrape
+            logger.error("Unexpected agenda items response for events %s: %r", event_ids, e)
+            return None
+
+        return agendas
     
-    def _parse_event(self, api_event):
+    def _parse_event(self, api_event, agenda_items=()):
         """
         Convert a Legistar API event dict into a Pupa Event object.
         
         Args:
             api_event: Dictionary from Legistar API
+            agenda_items: List of agenda item dicts for this event
             
         Returns:
             Event object or None if parsing fails
@@ -171,22 +330,30 @@ class SeattleEventScraper(Scraper):
             # Extract required fields from API response
             # Python dict access: api_event['key'] raises error if missing
             # api_event.get('key') returns None if missing (safer)
-            event_id = api_event['EventId']
-            event_name = api_event.get('EventBodyName', 'Meeting')
-            event_date_str = api_event['EventDate']
-            location = api_event.get('EventLocation', 'Location TBD')
+            # This runs once per event (thousands on a backfill), so look the
+            # bound methods up once instead of on every field read
+            get = api_event.get
+            getitem = api_event.__getitem__
+
+            event_id = getitem('EventId')
+            event_name = get('EventBodyName', 'Meeting')
+            event_date_str = getitem('EventDate')
+            location = get('EventLocation', 'Location TBD')
+            source_url = get('EventInSiteURL')
 
             # Parse the date string into a Python datetime object
-            # strptime = "string parse time"
-            # The format string tells Python how to interpret the date string
-            event_date = datetime.datetime.strptime(
-                event_date_str,
-                "%Y-%m-%dT%H:%M:%S"  # Format from Legistar
-            )
+            # Legistar sends ISO 8601 ("2024-01-15T09:30:00"), which
+            # fromisoformat() parses in C - much faster than strptime()
+            event_date = datetime.datetime.fromisoformat(event_date_str)
 
-            # Localize to Seattle timezone
-            # Without this, the datetime is "naive" (no timezone info)
-            event_date = self.TIMEZONE.localize(event_date)
+            # Attach Seattle timezone
+            # Legistar normally sends "naive" local times (no timezone info),
+            # so we attach Seattle's zone; if the string carried its own
+            # offset (e.g. a trailing "Z"), convert instead of overwriting it
+            if event_date.tzinfo is None:
+                event_date = event_date.replace(tzinfo=self.TIMEZONE)
+            else:
+                event_date = event_date.astimezone(self.TIMEZONE)
 
             # Create Pupa Event object
             # This is the core Open Civic Data model
@@ -201,33 +368,51 @@ class SeattleEventScraper(Scraper):
             
             # Add source URL for transparency/debugging
             # Legistar provides a web page for each event
-            if api_event.get('EventInSiteURL'):
-                event.add_source(api_event['EventInSiteURL'])
+            if source_url:
+                event.add_source(source_url)
 
             # Note: Event objects don't have add_identifier() method
             # Pupa uses the source URL and event details for deduplication instead
             
-            # TODO: Add agenda items (we'll implement this next)
-            # self._add_agenda_items(event, event_id)
+            # Attach the agenda items fetched earlier in scrape()
+            self._add_agenda_items(event, agenda_items)
             
-            logger.info(f"Parsed event: {event_name} on {event_date.date()}")
+            logger.info("Parsed event: %s on %s", event_name, event_date)
             
             return event
             
         except (KeyError, ValueError) as e:
             # KeyError: missing required field in API response
             # ValueError: date parsing failed
-            logger.warning(f"Failed to parse event {api_event.get('EventId')}: {e}")
+            logger.warning("Failed to parse event %s: %s", api_event.get('EventId'), e)
             return None
 
+    def _add_agenda_items(self, event, agenda_items):
+        """
+        Add substantive agenda items to a Pupa Event.
+
+        Args:
+            event: Pupa Event object to add items to
+            agenda_items: List of agenda item dicts from Legistar
+        """
+
+        for api_item in agenda_items:
+            title = (api_item.get('EventItemTitle') or '').strip()
+
+            if not title or not self._should_include_agenda_item(title):
+                continue
+
+            event.add_agenda_item(title)
+
+    def _should_include_agenda_item(self, title):
+        """
+        Decide whether an agenda item is substantive.
+
+        Args:
+            title: Agenda item title
+
+        Returns:
+            False for procedural items (see IGNORE_RE), True otherwise
+        """
 
-# ============================================================================
-# NEXT STEPS TO IMPLEMENT:
-# ============================================================================
-#
-# 1. Add _add_agenda_items() method to fetch and add agenda items
-# 2. Add _should_include_agenda_item() to filter out procedural items
-# 3. Test with: docker compose run --rm app pupa update seattle events --scrape
-# 4. Once working, register in seattle/__init__.py
-#
-# ============================================================================
\ No newline at end of file
+        return not self.IGNORE_RE.match(title)
\ No newline at end of file
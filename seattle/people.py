@@ -1,14 +1,39 @@
 from pupa.scrape import Scraper, Person
-import requests
 from lxml import html as lxml_html
+from lxml.etree import XPath
 import re
 import logging
 
+from .utils import make_session
+
 logger = logging.getLogger(__name__)
 
+# Council member list items ("District X: ..." / "Position X: ...")
+# XPath() compiles the expression once instead of on every scrape
+_MEMBER_XPATH = XPath(
+    '//ul/li[starts-with(normalize-space(text()), "District ")'
+    ' or starts-with(normalize-space(text()), "Position ")]'
+)
+
+# "District 3: Joy Hollingsworth" -> ("District", "3", "Joy Hollingsworth")
+_ITEM_RE = re.compile(r'(District|Position)\s+(\d+):\s*(.+)')
+
+# Turns spaces into dots when building email addresses
+_EMAIL_TRANSLATE = str.maketrans({' ': '.'})
+
+# Verified addresses for members whose email doesn't follow the
+# first.last@seattle.gov pattern, keyed by name as it appears on the page
+# e.g. {"Jane Q. Public": "jane.public@seattle.gov"}
+_EMAIL_OVERRIDES = {}
+
 
 class SeattlePersonScraper(Scraper):
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Cached on disk when SEATTLE_SCRAPER_CACHE=1
+        self._session = make_session("seattle_gov")
 
     def scrape(self):
         """
@@ -16,18 +41,18 @@ class SeattlePersonScraper(Scraper):
         """
         url = "https://www.seattle.gov/council/members"
         
-        response = requests.get(url)
+        response = self._session.get(url)
         html = lxml_html.fromstring(response.content)
         
         # Find all councilmember sections
         # The page has "District X:" or "Position X:" followed by name links
-        member_items = html.xpath('//ul/li[contains(text(), "District") or contains(text(), "Position")]')
+        member_items = _MEMBER_XPATH(html)
         
         for item in member_items:
             text = item.text_content().strip()
 
             # Parse district/position and name
-            match = re.match(r'(District|Position) (\d+):\s*(.+)', text)
+            match = _ITEM_RE.match(text)
             
             if match:
                 district_type = match.group(1)
@@ -52,20 +77,29 @@ class SeattlePersonScraper(Scraper):
                 )
 
                 person.add_source(url)
+                # Prefer a verified address; otherwise guess first.last@seattle.gov
+                # and label it as a guess so it isn't passed off as official
+                email = _EMAIL_OVERRIDES.get(name)
+                if email:
+                    note = "Official email"
+                else:
+                    email = f"{name.translate(_EMAIL_TRANSLATE).lower()}@seattle.gov"
+                    note = "Unverified email (guessed from name)"
+
                 person.add_contact_detail(
                     type="email",
-                    value=f"{name.replace(' ', '.').lower()}@seattle.gov",
-                    note="Official email"
+                    value=email,
+                    note=note
                 )
                 
                 # Build profile link
-                name_anchor = name.replace(" ", "")
+                name_anchor = "".join(name.split())
                 profile_url = f"{url}#{name_anchor}"
                 person.add_link(profile_url, note="City Council profile")
 
-                self.info(f"Scraped person: {name} ({district})")
+                self.info("Scraped person: %s (%s)", name, district)
 
                 yield person
             else:
-                logger.warning(f"Could not parse council member info from text: {text}")
+                logger.warning("Could not parse council member info from text: %s", text)
         pass
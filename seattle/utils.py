@@ -0,0 +1,83 @@
+"""
+Shared HTTP helpers for the Seattle scrapers.
+"""
+
+import datetime
+import os
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Set SEATTLE_SCRAPER_CACHE=1 to keep responses on disk between runs.
+# Handy while iterating locally; leave it unset in production so every
+# pupa run sees fresh data.
+CACHE_ENABLED = os.environ.get("SEATTLE_SCRAPER_CACHE") == "1"
+CACHE_DIR = ".cache"
+
+USER_AGENT = "seattle-councilmatic/1.0"
+
+
+class JitterRetry(Retry):
+    """
+    urllib3 Retry with a little random jitter added to each backoff,
+    so parallel requests that fail together don't all retry together.
+    """
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, 0.25) if backoff else backoff
+
+
+def make_retry():
+    """
+    Retry policy for scraper requests: exponential backoff on connection
+    errors and transient 429/5xx responses, honoring Retry-After.
+    """
+
+    return JitterRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    )
+
+
+def make_session(cache_name, expire_after=datetime.timedelta(hours=6)):
+    """
+    Build the HTTP session a scraper should use.
+
+    Args:
+        cache_name: Name of the on-disk cache (stored under CACHE_DIR)
+        expire_after: Default lifetime of a cached response
+
+    Returns:
+        A requests_cache.CachedSession when caching is enabled,
+        otherwise a plain requests.Session. Either way, connections are
+        pooled and kept alive across requests, and failed requests are
+        retried with backoff (see make_retry).
+    """
+
+    if CACHE_ENABLED:
+        # requests-cache is a development-only dependency, so only import
+        # it when caching is switched on
+        import requests_cache
+
+        # Query params are part of the cache key, so each OData
+        # $filter/$orderby combination is cached separately
+        session = requests_cache.CachedSession(
+            os.path.join(CACHE_DIR, cache_name),
+            expire_after=expire_after,
+            allowable_codes=(200,),
+        )
+    else:
+        session = requests.Session()
+
+    session.headers["User-Agent"] = USER_AGENT
+
+    adapter = HTTPAdapter(max_retries=make_retry())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
@@ -8,6 +8,10 @@ from councilmatic_core.models import Person as CouncilPerson
 class Command(BaseCommand):
     help = 'Sync OCD data to Councilmatic models (Person, Organization, etc.)'
 
+    # Rows inserted per statement. Each batch commits on its own, so a
+    # large backfill never holds table locks for the whole sync.
+    BATCH_SIZE = 10000
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--model',
@@ -19,69 +23,119 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         model = options['model']
 
-        if model in ['people', 'all']:
-            self.sync_people()
+        # One cursor for the whole run, shared by every sync step
+        with connection.cursor() as cursor:
+            if model in ['people', 'all']:
+                self.sync_people(cursor)
 
-        if model in ['events', 'all']:
-            self.sync_events()
+            if model in ['events', 'all']:
+                self.sync_events(cursor)
 
         if model in ['organizations', 'all']:
             self.stdout.write('Organization sync not yet implemented')
 
         self.stdout.write(self.style.SUCCESS('\n✓ Sync complete!'))
 
-    def sync_people(self):
+    def sync_people(self, cursor):
         self.stdout.write('\nSyncing people...')
         
-        # Use raw SQL for reliability
-        with connection.cursor() as cursor:
-            # Insert with conflict handling
-            cursor.execute("""
+        # Use raw SQL for reliability: insert new people in batches and
+        # return (selected, created, exact total) - see execute_in_batches
+        sql = """
+            WITH batch AS (
+                SELECT id, name
+                FROM opencivicdata_person p
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM councilmatic_core_person c
+                    WHERE c.person_id = p.id
+                )
+                LIMIT %s
+            ), ins AS (
                 INSERT INTO councilmatic_core_person (person_id, slug, headshot, councilmatic_biography)
                 SELECT 
                     id as person_id,
                     lower(regexp_replace(name, '[^a-zA-Z0-9]+', '-', 'g')) as slug,
                     '' as headshot,
                     NULL as councilmatic_biography
-                FROM opencivicdata_person
-                WHERE id NOT IN (SELECT person_id FROM councilmatic_core_person)
+                FROM batch
                 ON CONFLICT (person_id) DO NOTHING
-            """)
-            
-            created = cursor.rowcount
-            
-            # Get total count
-            cursor.execute("SELECT COUNT(*) FROM councilmatic_core_person")
-            total = cursor.fetchone()[0]
+                RETURNING 1
+            )
+            SELECT
+                (SELECT COUNT(*) FROM batch) AS selected,
+                (SELECT COUNT(*) FROM ins) AS created,
+                (SELECT COUNT(*) FROM councilmatic_core_person)
+                    + (SELECT COUNT(*) FROM ins) AS total
+        """
+
+        created, total = self.execute_in_batches(cursor, sql)
         
         self.stdout.write(self.style.SUCCESS(
             f'  ✓ People: {created} created, {total} total'
         ))
 
-    def sync_events(self):
+    def sync_events(self, cursor):
         self.stdout.write('\nSyncing events...')
 
-        # Use raw SQL for reliability
-        with connection.cursor() as cursor:
-            # Insert with conflict handling
-            # Make slug unique by appending start date
-            cursor.execute("""
+        # Use raw SQL for reliability: slug is made unique by appending start
+        # date; total is the planner's pre-insert estimate (or an exact count if
+        # never ANALYZEd) plus the rows this batch inserted
+        sql = """
+            WITH batch AS (
+                SELECT id, name, start_date
+                FROM opencivicdata_event e
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM councilmatic_core_event c
+                    WHERE c.event_id = e.id
+                )
+                LIMIT %s
+            ), ins AS (
                 INSERT INTO councilmatic_core_event (event_id, slug)
                 SELECT
                     id as event_id,
                     lower(regexp_replace(name, '[^a-zA-Z0-9]+', '-', 'g'))
                         || '-' || to_char(start_date::timestamp, 'YYYY-MM-DD-HH24-MI-SS') as slug
-                FROM opencivicdata_event
-                WHERE id NOT IN (SELECT event_id FROM councilmatic_core_event)
+                FROM batch
                 ON CONFLICT (event_id) DO NOTHING
-            """)
-
-            created = cursor.rowcount
+                RETURNING 1
+            )
+            SELECT
+                (SELECT COUNT(*) FROM batch) AS selected,
+                (SELECT COUNT(*) FROM ins) AS created,
+                (SELECT CASE
+                     WHEN reltuples >= 0 THEN reltuples::bigint
+                     ELSE (SELECT COUNT(*) FROM councilmatic_core_event)
+                 END
+                 FROM pg_class
+                 WHERE oid = 'councilmatic_core_event'::regclass)
+                    + (SELECT COUNT(*) FROM ins) AS approx_total
+        """
 
-            # Get total count
-            cursor.execute("SELECT COUNT(*) FROM councilmatic_core_event")
-            total = cursor.fetchone()[0]
+        created, total = self.execute_in_batches(cursor, sql)
 
         self.stdout.write(self.style.SUCCESS(
-            f'  ✓ Events: {created} created, {total} total'
-        ))
\ No newline at end of file
+            f'  ✓ Events: {created} created, ~{total} total'
+        ))
+
+    def execute_in_batches(self, cursor, sql):
+        """
+        Run a batched sync statement until it selects a short batch.
+
+        `sql` must take BATCH_SIZE as its only parameter and return a
+        single (selected, created, total) row. We stop on `selected`, not
+        `created`: rows a concurrent sync inserted first are skipped by
+        ON CONFLICT, but the remaining rows still need syncing. With
+        Django's autocommit each execute() is its own short transaction.
+
+        Returns:
+            (total rows created, table size from the last batch)
+        """
+        created = 0
+
+        while True:
+            cursor.execute(sql, [self.BATCH_SIZE])
+            selected, batch_created, total = cursor.fetchone()
+            created += batch_created
+
+            if selected < self.BATCH_SIZE:
+                return created, total